@@ -35,12 +35,28 @@ const LANGUAGE_LABELS: Record<string, string> = {
   javascript: "JavaScript",
 };
 
+const FILE_EXTENSIONS: Record<string, string> = {
+  python: "py",
+  cpp: "cpp",
+  c: "c",
+  java: "java",
+  javascript: "js",
+};
+
 const DIFF_CONFIG: Record<string, { label: string; color: string; bg: string }> = {
   E: { label: "Easy",   color: "text-green-400",  bg: "bg-green-400/20 border-green-400/30" },
   M: { label: "Medium", color: "text-yellow-400", bg: "bg-yellow-400/20 border-yellow-400/30" },
   H: { label: "Hard",   color: "text-red-400",    bg: "bg-red-400/20 border-red-400/30" },
 };
 
+const LANGUAGE_COLORS: Record<string, string> = {
+  python: "bg-blue-400/70", cpp: "bg-purple-400/70", c: "bg-orange-400/70",
+  java: "bg-red-400/70", javascript: "bg-yellow-400/70",
+};
+
+const HINT_LEVEL_COLORS = ["", "text-blue-400", "text-yellow-400", "text-orange-400"];
+const HINT_LEVEL_LABELS = ["", "💡 Conceptual", "🔧 Algorithmic", "🗺️ Near-Solution"];
+
 type LeftTab = "description" | "notes" | "discussions" | "editorial";
 
 // ─── Stats Bar ──────────────────────────────────────────────────────────────
@@ -57,11 +73,6 @@ function StatsBar({ shortCode }: { shortCode: string }) {
 
   if (!data) return null;
 
-  const langColors: Record<string, string> = {
-    python: "bg-blue-400/70", cpp: "bg-purple-400/70", c: "bg-orange-400/70",
-    java: "bg-red-400/70", javascript: "bg-yellow-400/70",
-  };
-
   return (
     <div className="flex flex-wrap items-center gap-4 text-xs text-gray-500 mt-3 pt-3 border-t border-[#2d3748]">
       <div className="flex items-center gap-1.5">
@@ -75,7 +86,7 @@ function StatsBar({ shortCode }: { shortCode: string }) {
       </div>
       {data.languageBreakdown.slice(0, 3).map((lang) => (
         <div key={lang.language} className="flex items-center gap-1">
-          <div className={`w-2 h-2 rounded-full ${langColors[lang.language] ?? "bg-gray-500"}`} />
+          <div className={`w-2 h-2 rounded-full ${LANGUAGE_COLORS[lang.language] ?? "bg-gray-500"}`} />
           <span className="capitalize">{lang.language} ({lang.count})</span>
         </div>
       ))}
@@ -217,9 +228,6 @@ function HintPanel({
     setLoading(false);
   };
 
-  const levelColors = ["", "text-blue-400", "text-yellow-400", "text-orange-400"];
-  const levelLabels = ["", "💡 Conceptual", "🔧 Algorithmic", "🗺️ Near-Solution"];
-
   return (
     <div className="mt-3 rounded-xl border border-[#00d4aa]/20 bg-[#00d4aa]/5 overflow-hidden">
       <div className="flex items-center justify-between px-4 py-2.5 bg-[#00d4aa]/10 border-b border-[#00d4aa]/20">
@@ -238,7 +246,7 @@ function HintPanel({
               onClick={() => { setLevel(l); fetchHint(l); }}
               className={`flex-1 py-1.5 rounded-lg text-xs font-semibold border transition-all ${
                 level === l
-                  ? `${levelColors[l]} bg-white/5 border-current`
+                  ? `${HINT_LEVEL_COLORS[l]} bg-white/5 border-current`
                   : "text-gray-500 border-[#2d3748] hover:border-gray-500"
               }`}
             >
@@ -252,7 +260,7 @@ function HintPanel({
             onClick={() => fetchHint(level)}
             className="w-full py-2 rounded-lg bg-[#00d4aa]/20 text-[#00d4aa] text-sm font-semibold hover:bg-[#00d4aa]/30 transition-all"
           >
-            Get {levelLabels[level]} Hint
+            Get {HINT_LEVEL_LABELS[level]} Hint
           </button>
         )}
 
@@ -834,12 +842,11 @@ export default function ProblemDetail() {
       if ((e.ctrlKey || e.metaKey) && e.key === "d") {
         e.preventDefault();
         if (code.trim()) {
-          const ext: Record<string, string> = { python: "py", cpp: "cpp", c: "c", java: "java", javascript: "js" };
           const blob = new Blob([code], { type: "text/plain" });
           const url = URL.createObjectURL(blob);
           const a = document.createElement("a");
           a.href = url;
-          a.download = `${shortCode}.${ext[language] || "txt"}`;
+          a.download = `${shortCode}.${FILE_EXTENSIONS[language] || "txt"}`;
           a.click();
           URL.revokeObjectURL(url);
         }
@@ -1088,12 +1095,11 @@ export default function ProblemDetail() {
             {/* Download code */}
             <button
               onClick={() => {
-                const ext: Record<string, string> = { python: "py", cpp: "cpp", c: "c", java: "java", javascript: "js" };
                 const blob = new Blob([code], { type: "text/plain" });
                 const url = URL.createObjectURL(blob);
                 const a = document.createElement("a");
                 a.href = url;
-                a.download = `${shortCode}.${ext[language] || "txt"}`;
+                a.download = `${shortCode}.${FILE_EXTENSIONS[language] || "txt"}`;
                 a.click();
                 URL.revokeObjectURL(url);
               }}
@@ -1232,12 +1238,6 @@ function SimilarProblemsPanel({ shortCode }: { shortCode: string }) {
   const similar = data?.similar ?? [];
   if (similar.length === 0) return null;
 
-  const DIFF_COLORS: Record<string, string> = {
-    E: "text-green-400",
-    M: "text-yellow-400",
-    H: "text-red-400",
-  };
-
   return (
     <div className="mt-4 bg-[#1a1f29] rounded-xl border border-[#00d4aa]/20 overflow-hidden">
       <div className="flex items-center gap-2 px-4 py-2.5 bg-[#00d4aa]/5 border-b border-[#00d4aa]/20">
@@ -1261,7 +1261,7 @@ function SimilarProblemsPanel({ shortCode }: { shortCode: string }) {
                   {t}
                 </span>
               ))}
-              <span className={`text-xs font-bold ${DIFF_COLORS[p.difficulty]}`}>
+              <span className={`text-xs font-bold ${DIFF_CONFIG[p.difficulty]?.color ?? ""}`}>
                 {p.difficulty === "E" ? "Easy" : p.difficulty === "M" ? "Medium" : "Hard"}
               </span>
               <ChevronRight className="w-3.5 h-3.5 text-gray-600 group-hover:text-[#00d4aa]" />
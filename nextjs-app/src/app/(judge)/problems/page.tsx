@@ -95,18 +95,14 @@ export default function ProblemsPage() {
     return passesDifficulty && passesNumber && passesTopics;
   });
 
-  const counts = {
-    ALL: problems?.length ?? 0,
-    E:   problems?.filter((p) => p.difficulty === "E").length ?? 0,
-    M:   problems?.filter((p) => p.difficulty === "M").length ?? 0,
-    H:   problems?.filter((p) => p.difficulty === "H").length ?? 0,
-  };
-
-  const solvedCounts = {
-    E: problems?.filter((p) => p.difficulty === "E" && solvedSet.has(p.id)).length ?? 0,
-    M: problems?.filter((p) => p.difficulty === "M" && solvedSet.has(p.id)).length ?? 0,
-    H: problems?.filter((p) => p.difficulty === "H" && solvedSet.has(p.id)).length ?? 0,
-  };
+  // Per-difficulty totals and solved counts in a single pass over the list
+  const counts: Record<string, number> = { ALL: problems?.length ?? 0, E: 0, M: 0, H: 0 };
+  const solvedCounts: Record<string, number> = { E: 0, M: 0, H: 0 };
+  for (const p of problems ?? []) {
+    if (!(p.difficulty in solvedCounts)) continue;
+    counts[p.difficulty]++;
+    if (solvedSet.has(p.id)) solvedCounts[p.difficulty]++;
+  }
 
   return (
     <div className="min-h-screen bg-[#0f1419]">
@@ -1,21 +1,32 @@
 "use client";
 
 import { useQuery } from "@tanstack/react-query";
+import { useState } from "react";
 import Link from "next/link";
 import { formatDistanceToNow } from "date-fns";
-import { AlertCircle, ExternalLink } from "lucide-react";
+import { AlertCircle, ExternalLink, ChevronLeft, ChevronRight } from "lucide-react";
 import { VerdictBadge } from "@/components/ui/VerdictBadge";
 
+const PAGE_LIMIT = 25;
+
 export default function SubmissionsPage() {
-  const { data: submissions, isLoading, isError, refetch } = useQuery({
-    queryKey: ["submissions"],
+  const [page, setPage] = useState(1);
+
+  const { data, isLoading, isError, refetch } = useQuery({
+    queryKey: ["submissions", page],
     queryFn: async () => {
-      const res = await fetch("/api/submissions");
+      const res = await fetch(`/api/submissions?page=${page}&limit=${PAGE_LIMIT}`);
       if (!res.ok) throw new Error("Failed to fetch submissions");
       return res.json();
     },
+    // New submissions invalidate ["submissions"] from the problem page, so cached pages stay correct
+    staleTime: 30_000,
   });
 
+  const submissions = data?.submissions;
+  const total = data?.total ?? 0;
+  const totalPages = Math.ceil(total / PAGE_LIMIT);
+
   return (
     <div className="min-h-screen bg-[#0f1419]">
       <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
@@ -90,6 +101,31 @@ export default function SubmissionsPage() {
               )}
             </tbody>
           </table>
+
+          {/* Pagination */}
+          {totalPages > 1 && (
+            <div className="flex items-center justify-between px-6 py-3 border-t border-[#2d3748]">
+              <p className="text-sm text-gray-400">
+                Page {page} of {totalPages}
+              </p>
+              <div className="flex gap-2">
+                <button
+                  onClick={() => setPage((p) => Math.max(1, p - 1))}
+                  disabled={page === 1}
+                  className="p-2 rounded text-gray-300 hover:text-white hover:bg-[#2d3748] disabled:opacity-40 disabled:cursor-not-allowed transition-colors"
+                >
+                  <ChevronLeft className="w-4 h-4" />
+                </button>
+                <button
+                  onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
+                  disabled={page === totalPages}
+                  className="p-2 rounded text-gray-300 hover:text-white hover:bg-[#2d3748] disabled:opacity-40 disabled:cursor-not-allowed transition-colors"
+                >
+                  <ChevronRight className="w-4 h-4" />
+                </button>
+              </div>
+            </div>
+          )}
         </div>
       </div>
     </div>
@@ -36,9 +36,16 @@ export default function AdminEditProblem() {
   const { data: problem, isLoading } = useQuery<Problem>({
     queryKey: ["adminProblem", shortCode],
     queryFn: async () => {
-      const res = await fetch(`/api/problems/${shortCode}`);
+      // The problem endpoint leaves out the editorial; admins always get it from the editorial route
+      const [res, editorialRes] = await Promise.all([
+        fetch(`/api/problems/${shortCode}`),
+        fetch(`/api/problems/${shortCode}/editorial`),
+      ]);
       if (!res.ok) throw new Error("Failed to fetch problem");
-      return res.json();
+      // Without the editorial the form would save it back as empty, so fail the whole load
+      if (!editorialRes.ok) throw new Error("Failed to fetch editorial");
+      const [problem, { editorial, editorialCode }] = await Promise.all([res.json(), editorialRes.json()]);
+      return { ...problem, editorial, editorialCode };
     },
   });
 
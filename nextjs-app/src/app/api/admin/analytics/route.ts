@@ -12,7 +12,6 @@ export async function GET() {
     const [
       totalUsers,
       totalProblems,
-      totalSubmissions,
       totalBookmarks,
       totalBadgesAwarded,
       submissionsByVerdict,
@@ -23,7 +22,6 @@ export async function GET() {
     ] = await Promise.all([
       prisma.user.count(),
       prisma.problem.count(),
-      prisma.submission.count(),
       prisma.bookmark.count(),
       prisma.userBadge.count(),
       prisma.submission.groupBy({ by: ["verdict"], _count: { _all: true } }),
@@ -31,7 +29,11 @@ export async function GET() {
       prisma.submission.findMany({
         take: 8,
         orderBy: { submitted: "desc" },
-        include: {
+        select: {
+          id: true,
+          language: true,
+          verdict: true,
+          submitted: true,
           user: { select: { name: true, email: true, id: true } },
           problem: { select: { name: true, shortCode: true } },
         },
@@ -53,6 +55,9 @@ export async function GET() {
       }),
     ]);
 
+    // The verdict breakdown covers every submission, so the total falls out of it
+    const totalSubmissions = submissionsByVerdict.reduce((sum, v) => sum + v._count._all, 0);
+
     // Enrich top solvers with user info
     const topSolverIds = topSolvers.map((s) => s.userId);
     const solverUsers = await prisma.user.findMany({
@@ -1,8 +1,9 @@
 import { NextResponse } from "next/server";
 import { auth } from "@/lib/auth";
-import { prisma } from "@/lib/db";
+import { prisma, isPrismaError } from "@/lib/db";
 import { createProblemSchema } from "@/lib/validations";
 import { getTopicTags } from "@/lib/groq";
+import { invalidateTag, PROBLEMS_TAG } from "@/lib/cache";
 
 export async function GET(request: Request) {
   try {
@@ -39,17 +40,6 @@ export async function POST(request: Request) {
       );
     }
 
-    const existingProblem = await prisma.problem.findUnique({
-      where: { shortCode: result.data.shortCode },
-    });
-
-    if (existingProblem) {
-      return NextResponse.json(
-        { error: "Problem with this short code already exists" },
-        { status: 400 }
-      );
-    }
-
     // Auto-generate topic tags via Groq AI (non-blocking on failure)
     const topics = await getTopicTags(result.data.name, result.data.statement);
 
@@ -72,9 +62,17 @@ export async function POST(request: Request) {
         testCases: true,
       },
     });
+    invalidateTag(PROBLEMS_TAG);
 
     return NextResponse.json(problem, { status: 201 });
   } catch (error) {
+    // shortCode is unique — let the constraint catch duplicates instead of a racy pre-check
+    if (isPrismaError(error, "P2002")) {
+      return NextResponse.json(
+        { error: "Problem with this short code already exists" },
+        { status: 400 }
+      );
+    }
     console.error("Failed to create problem:", error);
     return NextResponse.json({ error: "Internal Server Error" }, { status: 500 });
   }
@@ -128,9 +126,20 @@ export async function PUT(request: Request) {
           testCases: true,
         },
       });
+      invalidateTag(PROBLEMS_TAG);
   
       return NextResponse.json(problem);
     } catch (error) {
+      // Same constraint-driven duplicate check as POST, without a pre-check query
+      if (isPrismaError(error, "P2002")) {
+        return NextResponse.json(
+          { error: "Problem with this short code already exists" },
+          { status: 400 }
+        );
+      }
+      if (isPrismaError(error, "P2025")) {
+        return NextResponse.json({ error: "Problem not found" }, { status: 404 });
+      }
       console.error("Failed to update problem:", error);
       return NextResponse.json({ error: "Internal Server Error" }, { status: 500 });
     }
@@ -158,6 +167,7 @@ export async function DELETE(request: Request) {
           prisma.testCase.deleteMany({ where: { problemId } }),
           prisma.problem.delete({ where: { id: problemId } }),
         ]);
+        invalidateTag(PROBLEMS_TAG);
     
         return new NextResponse(null, { status: 204 });
       } catch (error) {
@@ -15,11 +15,16 @@ export async function GET(request: Request) {
     const skip = (page - 1) * limit;
 
     const [submissions, total] = await Promise.all([
+      // select (not include) keeps codeText out of the list — it's only shown on the detail page
       prisma.submission.findMany({
         orderBy: { submitted: "desc" },
         take: limit,
         skip,
-        include: {
+        select: {
+          id: true,
+          language: true,
+          verdict: true,
+          submitted: true,
           user: {
             select: { id: true, name: true, email: true, image: true },
           },
@@ -1,6 +1,6 @@
 import { NextResponse } from "next/server";
 import { auth } from "@/lib/auth";
-import { prisma } from "@/lib/db";
+import { prisma, isPrismaError } from "@/lib/db";
 
 type RouteContext = { params: Promise<{ id: string }> };
 
@@ -27,21 +27,24 @@ export async function POST(_req: Request, context: RouteContext) {
       return NextResponse.json({ error: "Contest has ended" }, { status: 400 });
     }
 
-    const existing = await prisma.contestRegistration.findUnique({
-      where: { contestId_userId: { contestId, userId: session.user.id } },
+    // Unregister if a registration exists — the delete doubles as the existence check
+    const { count } = await prisma.contestRegistration.deleteMany({
+      where: { contestId, userId: session.user.id },
     });
-
-    if (existing) {
-      // Unregister
-      await prisma.contestRegistration.delete({ where: { id: existing.id } });
+    if (count > 0) {
       return NextResponse.json({ registered: false });
-    } else {
-      // Register
+    }
+
+    // Register
+    try {
       await prisma.contestRegistration.create({
         data: { contestId, userId: session.user.id },
       });
-      return NextResponse.json({ registered: true });
+    } catch (error) {
+      // P2002 = a concurrent request already registered this user
+      if (!isPrismaError(error, "P2002")) throw error;
     }
+    return NextResponse.json({ registered: true });
   } catch (error) {
     console.error("Contest register POST error:", error);
     return NextResponse.json({ error: "Server error" }, { status: 500 });
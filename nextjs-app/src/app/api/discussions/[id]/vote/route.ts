@@ -1,6 +1,6 @@
 import { NextResponse } from "next/server";
 import { auth } from "@/lib/auth";
-import { prisma } from "@/lib/db";
+import { prisma, isPrismaError } from "@/lib/db";
 
 type RouteContext = { params: Promise<{ id: string }> };
 
@@ -19,10 +19,7 @@ export async function POST(request: Request, context: RouteContext) {
       return NextResponse.json({ error: "Value must be 1 or -1" }, { status: 400 });
     }
 
-    const discussion = await prisma.discussion.findUnique({ where: { id: discussionId } });
-    if (!discussion) return NextResponse.json({ error: "Not found" }, { status: 404 });
-
-    // Check existing vote
+    // Check existing vote (an existing vote implies the discussion exists)
     const existing = await prisma.discussionVote.findUnique({
       where: { discussionId_userId: { discussionId, userId: session.user.id } },
     });
@@ -41,15 +38,25 @@ export async function POST(request: Request, context: RouteContext) {
         });
       }
     } else {
-      // New vote
-      await prisma.discussionVote.create({
-        data: { discussionId, userId: session.user.id, value },
-      });
+      // New vote — the foreign key rejects a missing discussion (P2003)
+      try {
+        await prisma.discussionVote.create({
+          data: { discussionId, userId: session.user.id, value },
+        });
+      } catch (error) {
+        if (isPrismaError(error, "P2003")) {
+          return NextResponse.json({ error: "Not found" }, { status: 404 });
+        }
+        throw error;
+      }
     }
 
     // Return updated vote score
-    const votes = await prisma.discussionVote.findMany({ where: { discussionId } });
-    const voteScore = votes.reduce((sum, v) => sum + v.value, 0);
+    const { _sum } = await prisma.discussionVote.aggregate({
+      where: { discussionId },
+      _sum: { value: true },
+    });
+    const voteScore = _sum.value ?? 0;
 
     return NextResponse.json({ voteScore });
   } catch (error) {
@@ -1,5 +1,5 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { prisma, isPrismaError } from "@/lib/db";
 import { auth } from "@/lib/auth";
 
 type RouteContext = { params: Promise<{ shortCode: string }> };
@@ -12,11 +12,10 @@ export async function GET(_req: Request, context: RouteContext) {
       return NextResponse.json({ bookmarked: false });
     }
     const { shortCode } = await context.params;
-    const problem = await prisma.problem.findUnique({ where: { shortCode }, select: { id: true } });
-    if (!problem) return NextResponse.json({ bookmarked: false });
-
-    const bookmark = await prisma.bookmark.findUnique({
-      where: { userId_problemId: { userId: session.user.id, problemId: problem.id } },
+    // Filter through the relation so the problem lookup and bookmark check are one query
+    const bookmark = await prisma.bookmark.findFirst({
+      where: { userId: session.user.id, problem: { shortCode } },
+      select: { id: true },
     });
     return NextResponse.json({ bookmarked: !!bookmark });
   } catch (error) {
@@ -33,22 +32,31 @@ export async function POST(_req: Request, context: RouteContext) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
     const { shortCode } = await context.params;
-    const problem = await prisma.problem.findUnique({ where: { shortCode }, select: { id: true } });
-    if (!problem) return NextResponse.json({ error: "Not found" }, { status: 404 });
 
-    const existing = await prisma.bookmark.findUnique({
-      where: { userId_problemId: { userId: session.user.id, problemId: problem.id } },
+    // Try to remove the bookmark first; if nothing was deleted, this is a "bookmark" click
+    const { count } = await prisma.bookmark.deleteMany({
+      where: { userId: session.user.id, problem: { shortCode } },
     });
-
-    if (existing) {
-      await prisma.bookmark.delete({ where: { id: existing.id } });
+    if (count > 0) {
       return NextResponse.json({ bookmarked: false });
-    } else {
+    }
+
+    try {
       await prisma.bookmark.create({
-        data: { userId: session.user.id, problemId: problem.id },
+        data: {
+          user: { connect: { id: session.user.id } },
+          problem: { connect: { shortCode } },
+        },
       });
-      return NextResponse.json({ bookmarked: true });
+    } catch (error) {
+      // P2025 = connect target (the problem) doesn't exist
+      if (isPrismaError(error, "P2025")) {
+        return NextResponse.json({ error: "Not found" }, { status: 404 });
+      }
+      // P2002 = a concurrent request already bookmarked it
+      if (!isPrismaError(error, "P2002")) throw error;
     }
+    return NextResponse.json({ bookmarked: true });
   } catch (error) {
     console.error("Bookmark POST error:", error);
     return NextResponse.json({ error: "Server error" }, { status: 500 });
@@ -7,12 +7,23 @@ export async function GET(
 ) {
   try {
     const { shortCode } = await params;
+    // Only what the problem page renders — the editorial is served (and gated) by
+    // /api/problems/[shortCode]/editorial, so it stays out of this payload
     const problem = await prisma.problem.findUnique({
       where: { shortCode },
-      include: {
+      select: {
+        id: true,
+        name: true,
+        shortCode: true,
+        statement: true,
+        difficulty: true,
+        topics: true,
+        templates: true,
+        isDailyChallenge: true,
         testCases: {
           where: { isHidden: false },
           orderBy: { order: "asc" },
+          select: { id: true, input: true, output: true, isHidden: true, order: true },
         },
       },
     });
@@ -6,28 +6,32 @@ type RouteContext = { params: Promise<{ shortCode: string }> };
 export async function GET(_req: Request, context: RouteContext) {
   try {
     const { shortCode } = await context.params;
-    const problem = await prisma.problem.findUnique({
-      where: { shortCode },
-      select: { id: true },
-    });
+    // One GROUP BY (language, verdict) yields the total, the AC count and the language
+    // breakdown; it runs alongside the existing-problem check instead of after it
+    const [problem, groups] = await Promise.all([
+      prisma.problem.findUnique({
+        where: { shortCode },
+        select: { id: true },
+      }),
+      prisma.submission.groupBy({
+        by: ["language", "verdict"],
+        where: { problem: { shortCode } },
+        _count: { _all: true },
+      }),
+    ]);
 
     if (!problem) {
       return NextResponse.json({ error: "Problem not found" }, { status: 404 });
     }
 
-    // Count total submissions and AC submissions
-    const [total, accepted] = await Promise.all([
-      prisma.submission.count({ where: { problemId: problem.id } }),
-      prisma.submission.count({ where: { problemId: problem.id, verdict: "AC" } }),
-    ]);
-
-    // Language breakdown (only for AC submissions)
-    const langGroups = await prisma.submission.groupBy({
-      by: ["language"],
-      where: { problemId: problem.id },
-      _count: { language: true },
-      orderBy: { _count: { language: "desc" } },
-    });
+    let total = 0;
+    let accepted = 0;
+    const languageCounts = new Map<string, number>();
+    for (const g of groups) {
+      total += g._count._all;
+      if (g.verdict === "AC") accepted += g._count._all;
+      languageCounts.set(g.language, (languageCounts.get(g.language) ?? 0) + g._count._all);
+    }
 
     const acceptanceRate = total > 0 ? Math.round((accepted / total) * 100) : 0;
 
@@ -35,10 +39,9 @@ export async function GET(_req: Request, context: RouteContext) {
       total,
       accepted,
       acceptanceRate,
-      languageBreakdown: langGroups.map((g) => ({
-        language: g.language,
-        count: g._count.language,
-      })),
+      languageBreakdown: [...languageCounts]
+        .map(([language, count]) => ({ language, count }))
+        .sort((a, b) => b.count - a.count),
     });
   } catch (error) {
     console.error("Problem stats error:", error);
@@ -1,45 +1,50 @@
 import { NextResponse } from "next/server";
+import { unstable_cache } from "next/cache";
 import { prisma } from "@/lib/db";
+import { PROBLEMS_TAG } from "@/lib/cache";
+
+// The problem list is read on every visit but only changes through the admin
+// panel, so serve it from the data cache and let admin writes invalidate it.
+// Only the full list is cached — search/topic filters are applied to it in memory,
+// so arbitrary query strings can't each create a cache entry of their own.
+const getProblems = unstable_cache(
+  async () =>
+    prisma.problem.findMany({
+      orderBy: { id: "asc" },
+      select: {
+        id: true,
+        name: true,
+        shortCode: true,
+        difficulty: true,
+        statement: true,
+        topics: true,
+      },
+    }),
+  ["problems-list"],
+  { tags: [PROBLEMS_TAG], revalidate: 60 * 15 }
+);
 
 export async function GET(request: Request) {
   try {
     const { searchParams } = new URL(request.url);
-    const search = searchParams.get("search");
+    const search = searchParams.get("search")?.toLowerCase();
     const topic = searchParams.get("topic");
 
-    let whereClause: Record<string, unknown> = {};
+    let problems = await getProblems();
 
     if (search) {
-      whereClause = {
-        ...whereClause,
-        OR: [
-          { name: { contains: search, mode: "insensitive" } },
-          { statement: { contains: search, mode: "insensitive" } },
-          { shortCode: { contains: search, mode: "insensitive" } },
-        ],
-      };
+      problems = problems.filter(
+        (p) =>
+          p.name.toLowerCase().includes(search) ||
+          p.statement.toLowerCase().includes(search) ||
+          p.shortCode.toLowerCase().includes(search)
+      );
     }
 
     if (topic) {
-      whereClause = {
-        ...whereClause,
-        topics: { has: topic },
-      };
+      problems = problems.filter((p) => p.topics.includes(topic));
     }
 
-    const problems = await prisma.problem.findMany({
-      where: whereClause,
-      orderBy: { id: "asc" },
-      select: {
-        id: true,
-        name: true,
-        shortCode: true,
-        difficulty: true,
-        statement: true,
-        topics: true,
-      },
-    });
-
     return NextResponse.json(problems);
   } catch (error) {
     console.error("Failed to fetch problems:", error);
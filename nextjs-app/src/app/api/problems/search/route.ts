@@ -55,21 +55,15 @@ export async function GET(request: Request) {
       prisma.problem.count({ where }),
     ]);
 
-    // Get acceptance rates in one query
+    // Get acceptance rates in one query — per-problem totals already come from _count above
     const problemIds = problems.map((p) => p.id);
     const acCounts = await prisma.submission.groupBy({
       by: ["problemId"],
       where: { problemId: { in: problemIds }, verdict: "AC" },
       _count: true,
     });
-    const totalCounts = await prisma.submission.groupBy({
-      by: ["problemId"],
-      where: { problemId: { in: problemIds } },
-      _count: true,
-    });
 
     const acMap = new Map(acCounts.map((r) => [r.problemId, r._count]));
-    const totalMap = new Map(totalCounts.map((r) => [r.problemId, r._count]));
 
     // Get solved status for logged-in users
     let solvedSet = new Set<number>();
@@ -84,7 +78,7 @@ export async function GET(request: Request) {
 
     const enriched = problems.map((p) => {
       const ac = acMap.get(p.id) || 0;
-      const total = totalMap.get(p.id) || 0;
+      const total = p._count.submissions;
       const acceptanceRate = total > 0 ? Math.round((ac / total) * 100) : 0;
       return {
         ...p,
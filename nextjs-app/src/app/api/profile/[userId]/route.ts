@@ -9,32 +9,57 @@ export async function GET(_req: Request, context: RouteContext) {
     const { userId } = await context.params;
     const session = await auth();
 
-    const user = await prisma.user.findUnique({
-      where: { id: userId },
-      select: {
-        id: true,
-        name: true,
-        email: true,
-        image: true,
-        createdAt: true,
-        xp: true,
-        level: true,
-        streak: true,
-        _count: { select: { followers: true, following: true } },
-        userBadges: {
-          include: { badge: true },
-          orderBy: { awardedAt: "asc" },
-        },
-        submissions: {
-          where: { verdict: "AC" },
-          select: {
-            problemId: true,
-            submitted: true,
-            problem: { select: { difficulty: true } },
+    // Everything the profile needs that only depends on the ids runs as one batch
+    const [user, totalProblems, recentSubmissions, follow] = await Promise.all([
+      prisma.user.findUnique({
+        where: { id: userId },
+        select: {
+          id: true,
+          name: true,
+          email: true,
+          image: true,
+          createdAt: true,
+          xp: true,
+          level: true,
+          streak: true,
+          _count: { select: { followers: true, following: true } },
+          userBadges: {
+            include: { badge: true },
+            orderBy: { awardedAt: "asc" },
+          },
+          submissions: {
+            where: { verdict: "AC" },
+            select: {
+              problemId: true,
+              submitted: true,
+              problem: { select: { difficulty: true } },
+            },
           },
         },
-      },
-    });
+      }),
+      // Total problems for solve rate
+      prisma.problem.count(),
+      // Recent submissions (all verdicts, last 10)
+      prisma.submission.findMany({
+        where: { userId },
+        orderBy: { submitted: "desc" },
+        take: 10,
+        select: {
+          id: true,
+          verdict: true,
+          language: true,
+          submitted: true,
+          problem: { select: { name: true, shortCode: true, difficulty: true } },
+        },
+      }),
+      // Check if current user follows this profile
+      session?.user?.id && session.user.id !== userId
+        ? prisma.follow.findUnique({
+            where: { followerId_followingId: { followerId: session.user.id, followingId: userId } },
+            select: { id: true },
+          })
+        : null,
+    ]);
 
     if (!user) {
       return NextResponse.json({ error: "User not found" }, { status: 404 });
@@ -51,54 +76,28 @@ export async function GET(_req: Request, context: RouteContext) {
       }
     }
 
-    const solvedProblems = Array.from(acProblemMap.values());
-    const easyCount = solvedProblems.filter((p) => p.difficulty === "E").length;
-    const mediumCount = solvedProblems.filter((p) => p.difficulty === "M").length;
-    const hardCount = solvedProblems.filter((p) => p.difficulty === "H").length;
-    const totalSolved = solvedProblems.length;
+    // Solved counts per difficulty in a single pass
+    const solvedByDifficulty: Record<string, number> = { E: 0, M: 0, H: 0 };
+    for (const { difficulty } of acProblemMap.values()) {
+      if (difficulty in solvedByDifficulty) solvedByDifficulty[difficulty]++;
+    }
+    const { E: easyCount, M: mediumCount, H: hardCount } = solvedByDifficulty;
+    const totalSolved = acProblemMap.size;
     const score = easyCount * 1 + mediumCount * 2 + hardCount * 3;
 
-    // Total problems for solve rate
-    const totalProblems = await prisma.problem.count();
-
-    // Heatmap: count AC submissions per day (last 365 days)
+    // Heatmap: count AC submissions per day (last 365 days) — from the AC submissions
+    // already loaded with the user instead of querying them again
     const yearAgo = new Date(Date.now() - 365 * 24 * 60 * 60 * 1000);
-    const recentSubs = await prisma.submission.findMany({
-      where: {
-        userId,
-        verdict: "AC",
-        submitted: { gte: yearAgo },
-      },
-      select: { submitted: true },
-    });
-
     const heatmap: Record<string, number> = {};
-    for (const sub of recentSubs) {
+    for (const sub of user.submissions) {
+      if (sub.submitted < yearAgo) continue;
       const dateStr = sub.submitted.toISOString().split("T")[0];
       heatmap[dateStr] = (heatmap[dateStr] ?? 0) + 1;
     }
 
-    // Recent submissions (all verdicts, last 10)
-    const recentSubmissions = await prisma.submission.findMany({
-      where: { userId },
-      orderBy: { submitted: "desc" },
-      take: 10,
-      include: {
-        problem: { select: { name: true, shortCode: true, difficulty: true } },
-      },
-    });
-
     // Privacy: only show email if viewing own profile
     const isOwnProfile = session?.user?.id === userId;
-
-    // Check if current user follows this profile
-    let isFollowing = false;
-    if (session?.user?.id && session.user.id !== userId) {
-      const follow = await prisma.follow.findUnique({
-        where: { followerId_followingId: { followerId: session.user.id, followingId: userId } },
-      });
-      isFollowing = !!follow;
-    }
+    const isFollowing = !!follow;
 
     return NextResponse.json({
       user: {
@@ -2,10 +2,11 @@ import { NextResponse } from "next/server";
 import { auth } from "@/lib/auth";
 import { executeCode } from "@/lib/piston";
 import { z } from "zod";
+import { SUPPORTED_LANGUAGES } from "@/lib/validations";
 
 const runSchema = z.object({
   code: z.string().min(1, "Code is required"),
-  language: z.enum(["python", "cpp", "c", "java", "javascript"]),
+  language: z.enum(SUPPORTED_LANGUAGES),
   stdin: z.string().default(""),
 });
 
@@ -31,9 +32,9 @@ export async function POST(request: Request) {
 
     const runResult = await executeCode(language, code, stdin);
 
-    // Determine if it was a compilation error
+    // Determine if it was a compilation error (code -1 means Wandbox itself failed)
     const isCompileError =
-      runResult.code !== 0 && runResult.stderr && !runResult.stdout;
+      runResult.code !== 0 && runResult.code !== -1 && runResult.stderr && !runResult.stdout;
 
     return NextResponse.json({
       stdout: runResult.stdout || "",
@@ -1,16 +1,31 @@
 import { NextResponse } from "next/server";
+import { unstable_cache } from "next/cache";
 import { prisma } from "@/lib/db";
 
-// GET /api/stats — public platform-wide stats for the landing page
-export async function GET() {
-  try {
-    const [totalProblems, totalSubmissions, totalUsers, totalAC] = await Promise.all([
+// Landing-page counters don't need to be exact to the second — recompute at most once a minute
+const getPlatformStats = unstable_cache(
+  async () => {
+    const [totalProblems, totalUsers, verdictCounts] = await Promise.all([
       prisma.problem.count(),
-      prisma.submission.count(),
       prisma.user.count(),
-      prisma.submission.count({ where: { verdict: "AC" } }),
+      // One pass over submissions yields both the total and the AC count
+      prisma.submission.groupBy({ by: ["verdict"], _count: { _all: true } }),
     ]);
 
+    const totalSubmissions = verdictCounts.reduce((sum, v) => sum + v._count._all, 0);
+    const totalAC = verdictCounts.find((v) => v.verdict === "AC")?._count._all ?? 0;
+
+    return { totalProblems, totalSubmissions, totalUsers, totalAC };
+  },
+  ["platform-stats"],
+  { revalidate: 60 }
+);
+
+// GET /api/stats — public platform-wide stats for the landing page
+export async function GET() {
+  try {
+    const { totalProblems, totalSubmissions, totalUsers, totalAC } = await getPlatformStats();
+
     const acceptanceRate = totalSubmissions > 0
       ? Math.round((totalAC / totalSubmissions) * 100)
       : 0;
@@ -1,12 +1,35 @@
 import { NextResponse } from "next/server";
+import { unstable_cache } from "next/cache";
 import { auth } from "@/lib/auth";
-import { prisma } from "@/lib/db";
+import { prisma, isPrismaError } from "@/lib/db";
+import { PROBLEMS_TAG } from "@/lib/cache";
 import { submissionSchema } from "@/lib/validations";
-import { executeCode } from "@/lib/piston";
-import { evaluateExecution } from "@/lib/judge";
+import { prepareExecution, runPrepared } from "@/lib/piston";
+import { runTestCases } from "@/lib/judge";
 import { Verdict } from "@/types";
 import { processAcSubmission, seedBadges } from "@/lib/badges";
 
+// A problem's difficulty and test cases — only the columns the judge loop reads (id keys the
+// expected-output cache). Test cases only change through the admin panel, which invalidates
+// PROBLEMS_TAG, so submissions are judged from the data cache instead of re-querying them.
+// A missing problem throws (P2025) rather than returning null, so made-up ids are never
+// stored in the cache — only real problems get an entry.
+const getJudgeProblem = unstable_cache(
+  async (problemId: number) =>
+    prisma.problem.findUniqueOrThrow({
+      where: { id: problemId },
+      select: {
+        difficulty: true,
+        testCases: {
+          orderBy: { order: "asc" },
+          select: { id: true, input: true, output: true, isHidden: true },
+        },
+      },
+    }),
+  ["judge-problem"],
+  { tags: [PROBLEMS_TAG], revalidate: 60 * 15 }
+);
+
 export async function GET(request: Request) {
   try {
     const session = await auth();
@@ -15,7 +38,10 @@ export async function GET(request: Request) {
     }
 
     const { searchParams } = new URL(request.url);
-    const limit = parseInt(searchParams.get("limit") || "10");
+    // Non-numeric values fall back to the defaults; out-of-range ones are clamped
+    const page = Math.max(1, parseInt(searchParams.get("page") ?? "") || 1);
+    const limit = Math.min(100, Math.max(1, parseInt(searchParams.get("limit") ?? "") || 25));
+    const skip = (page - 1) * limit;
     const problemId = searchParams.get("problemId");
 
     let whereClause: any = { userId: session.user.id };
@@ -23,18 +49,28 @@ export async function GET(request: Request) {
       whereClause.problemId = parseInt(problemId);
     }
 
-    const submissions = await prisma.submission.findMany({
-      where: whereClause,
-      orderBy: { submitted: "desc" },
-      take: limit,
-      include: {
-        problem: {
-          select: { name: true, shortCode: true, difficulty: true },
+    const [submissions, total] = await Promise.all([
+      prisma.submission.findMany({
+        where: whereClause,
+        orderBy: { submitted: "desc" },
+        take: limit,
+        skip,
+        // List view never shows the source, so leave codeText out of the row
+        select: {
+          id: true,
+          problemId: true,
+          language: true,
+          verdict: true,
+          submitted: true,
+          problem: {
+            select: { name: true, shortCode: true, difficulty: true },
+          },
         },
-      },
-    });
+      }),
+      prisma.submission.count({ where: whereClause }),
+    ]);
 
-    return NextResponse.json(submissions);
+    return NextResponse.json({ submissions, total, page, limit });
   } catch (error) {
     console.error("Failed to fetch submissions:", error);
     return NextResponse.json(
@@ -63,28 +99,33 @@ export async function POST(request: Request) {
 
     const { problemId, codeText, language } = result.data;
 
-    // Create the submission initially with PE (Pending Evaluation)
-    const submission = await prisma.submission.create({
-      data: {
-        problemId,
-        userId: session.user.id,
-        codeText,
-        language,
-        verdict: "PE",
-      },
-    });
+    let problem: Awaited<ReturnType<typeof getJudgeProblem>>;
+    try {
+      problem = await getJudgeProblem(problemId);
+    } catch (error) {
+      if (isPrismaError(error, "P2025")) {
+        return NextResponse.json({ error: "Problem not found" }, { status: 404 });
+      }
+      throw error;
+    }
 
-    // Fetch test cases
-    const testCases = await prisma.testCase.findMany({
-      where: { problemId },
-      orderBy: { order: "asc" },
-    });
+    const testCases = problem.testCases;
+
+    // The submission row is written once, after judging, with its final verdict. Keep the
+    // receive time so `submitted` reflects when the code came in, not when judging ended.
+    const submissionData = {
+      problemId,
+      userId: session.user.id,
+      codeText,
+      language,
+      submitted: new Date(),
+    };
 
     if (testCases.length === 0) {
       // If no test cases, just accept it (for now, or maybe CE)
-      await prisma.submission.update({
-        where: { id: submission.id },
-        data: { verdict: "AC" },
+      const submission = await prisma.submission.create({
+        data: { ...submissionData, verdict: "AC" },
+        select: { id: true },
       });
       return NextResponse.json({ id: submission.id, verdict: "AC" });
     }
@@ -98,22 +139,22 @@ export async function POST(request: Request) {
     let failInfo: { input: string; expected: string; got: string } | null = null;
 
     try {
-      for (const testCase of testCases) {
-        const runResult = await executeCode(language, codeText, testCase.input);
-        const evalResult = evaluateExecution(runResult, testCase.output);
-
-        if (evalResult.verdict !== "AC") {
-          finalVerdict = evalResult.verdict;
-          finalErrorDetail = evalResult.details?.error || null;
-          // Capture diff info for first failing non-hidden test case
-          if (evalResult.verdict === "WA" && !testCase.isHidden) {
-            failInfo = {
-              input: testCase.input,
-              expected: testCase.output,
-              got: runResult.stdout || "",
-            };
-          }
-          break; // Stop on first failure
+      // Resolve language/code once; each test case only supplies new stdin
+      const prepared = prepareExecution(language, codeText);
+
+      const failure = await runTestCases((input) => runPrepared(prepared, input), testCases);
+
+      if (failure) {
+        const { testCase, runResult, evalResult } = failure;
+        finalVerdict = evalResult.verdict;
+        finalErrorDetail = evalResult.details?.error || null;
+        // Capture diff info for first failing non-hidden test case
+        if (evalResult.verdict === "WA" && !testCase.isHidden) {
+          failInfo = {
+            input: testCase.input,
+            expected: testCase.output,
+            got: runResult.stdout || "",
+          };
         }
       }
     } catch (execError) {
@@ -121,10 +162,10 @@ export async function POST(request: Request) {
       finalVerdict = "IE";
     }
 
-    // Update submission with final verdict
-    const updatedSubmission = await prisma.submission.update({
-      where: { id: submission.id },
-      data: { verdict: finalVerdict },
+    // Single INSERT with the final verdict — select keeps codeText out of the RETURNING clause
+    const submission = await prisma.submission.create({
+      data: { ...submissionData, verdict: finalVerdict },
+      select: { id: true, verdict: true },
     });
 
     // Award badges, XP & update streak on AC
@@ -137,12 +178,6 @@ export async function POST(request: Request) {
       try {
         await seedBadges(); // Ensure badge definitions exist (idempotent)
 
-        // Fetch problem difficulty for XP calculation
-        const prob = await prisma.problem.findUnique({
-          where: { id: problemId },
-          select: { difficulty: true },
-        });
-
         // Check if this is the user's first AC on this problem
         const prevAcCount = await prisma.submission.count({
           where: { userId: session.user.id!, problemId, verdict: "AC", id: { lt: submission.id } },
@@ -151,7 +186,7 @@ export async function POST(request: Request) {
 
         const result = await processAcSubmission(
           session.user.id!,
-          prob?.difficulty ?? "E",
+          problem.difficulty,
           isFirstAc
         );
         newlyAwardedBadges = result.awardedBadges;
@@ -164,8 +199,8 @@ export async function POST(request: Request) {
     }
 
     return NextResponse.json({ 
-      id: updatedSubmission.id, 
-      verdict: updatedSubmission.verdict,
+      id: submission.id, 
+      verdict: submission.verdict,
       errorDetail: finalErrorDetail,
       failInfo,
       newBadges: newlyAwardedBadges,
@@ -1,6 +1,6 @@
 import { NextResponse } from "next/server";
 import { auth } from "@/lib/auth";
-import { prisma } from "@/lib/db";
+import { prisma, isPrismaError } from "@/lib/db";
 
 type RouteContext = { params: Promise<{ userId: string }> };
 
@@ -15,9 +15,6 @@ export async function POST(_req: Request, context: RouteContext) {
       return NextResponse.json({ error: "Cannot follow yourself" }, { status: 400 });
     }
 
-    const target = await prisma.user.findUnique({ where: { id: userId }, select: { id: true, name: true } });
-    if (!target) return NextResponse.json({ error: "User not found" }, { status: 404 });
-
     const existing = await prisma.follow.findUnique({
       where: { followerId_followingId: { followerId: session.user.id, followingId: userId } },
     });
@@ -27,10 +24,18 @@ export async function POST(_req: Request, context: RouteContext) {
       await prisma.follow.delete({ where: { id: existing.id } });
       return NextResponse.json({ following: false });
     } else {
-      // Follow
-      await prisma.follow.create({
-        data: { followerId: session.user.id, followingId: userId },
-      });
+      // Follow — a missing target user surfaces as a foreign key violation,
+      // so there is no need for a separate existence lookup beforehand
+      try {
+        await prisma.follow.create({
+          data: { followerId: session.user.id, followingId: userId },
+        });
+      } catch (error) {
+        if (isPrismaError(error, "P2003")) {
+          return NextResponse.json({ error: "User not found" }, { status: 404 });
+        }
+        throw error;
+      }
       return NextResponse.json({ following: true });
     }
   } catch (error) {
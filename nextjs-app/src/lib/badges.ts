@@ -66,17 +66,23 @@ export function xpForNextLevel(currentLevel: number): number {
   return LEVEL_THRESHOLDS[currentLevel]; // threshold for level+1
 }
 
+let badgesSeeded: Promise<void> | null = null;
+
 /**
- * Seed all badge definitions into the DB (idempotent — uses upsert).
+ * Seed all badge definitions into the DB (idempotent — a single INSERT that skips
+ * existing slugs). Existing rows are left as-is, so edits to a badge's name,
+ * description or icon must be applied to the DB directly.
+ * Runs once per server process; a failed attempt is retried on the next call.
  */
-export async function seedBadges() {
-  for (const badge of BADGE_DEFINITIONS) {
-    await prisma.badge.upsert({
-      where: { slug: badge.slug },
-      update: { name: badge.name, description: badge.description, icon: badge.icon },
-      create: badge,
+export function seedBadges(): Promise<void> {
+  badgesSeeded ??= prisma.badge
+    .createMany({ data: BADGE_DEFINITIONS, skipDuplicates: true })
+    .then(() => undefined)
+    .catch((error) => {
+      badgesSeeded = null;
+      throw error;
     });
-  }
+  return badgesSeeded;
 }
 
 /**
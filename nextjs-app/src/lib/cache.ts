@@ -0,0 +1,57 @@
+// lib/cache.ts — Tags for data cached with unstable_cache, and their invalidation
+
+import { revalidateTag } from "next/cache";
+
+// Problem list / metadata — invalidated whenever an admin creates, edits or deletes a problem
+export const PROBLEMS_TAG = "problems";
+
+/**
+ * Expire every cache entry carrying `tag` immediately (next read goes to the DB).
+ */
+export function invalidateTag(tag: string) {
+  revalidateTag(tag, { expire: 0 });
+}
+
+// ─── In-memory bounded cache ─────────────────────────────────────────────────────
+
+export interface BoundedCache<K, V> {
+  get(key: K): V | undefined;
+  set(key: K, value: V): void;
+}
+
+/**
+ * A process-local Map capped both by entry count and by the total `sizeOf` of its values.
+ * When either cap would be exceeded, the oldest entries are evicted first (Maps iterate in
+ * insertion order). A value larger than `maxSize` on its own is simply not stored.
+ */
+export function createBoundedCache<K, V>(options: {
+  maxEntries: number;
+  maxSize: number;
+  sizeOf: (value: V) => number;
+}): BoundedCache<K, V> {
+  const entries = new Map<K, { value: V; size: number }>();
+  let totalSize = 0;
+
+  const remove = (key: K) => {
+    const entry = entries.get(key);
+    if (entry) {
+      totalSize -= entry.size;
+      entries.delete(key);
+    }
+  };
+
+  return {
+    get: (key) => entries.get(key)?.value,
+    set: (key, value) => {
+      const size = options.sizeOf(value);
+      remove(key);
+      if (size > options.maxSize) return;
+
+      while (entries.size >= options.maxEntries || totalSize + size > options.maxSize) {
+        remove(entries.keys().next().value!);
+      }
+      entries.set(key, { value, size });
+      totalSize += size;
+    },
+  };
+}
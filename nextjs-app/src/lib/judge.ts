@@ -1,10 +1,12 @@
 import { Verdict, RunResult, EvaluateResult } from "@/types";
+import { createBoundedCache } from "@/lib/cache";
 
 export function normalizeOutput(output: string): string[] {
   if (!output) return [];
   
-  // Split into lines, trim each line (leading + trailing), and remove trailing empty lines
-  const lines = output.split(/\r?\n/).map(line => line.trim());
+  // Split into lines, trim each line (leading + trailing), and remove trailing empty lines.
+  // A plain "\n" split is enough: trim() also drops the "\r" of CRLF line endings.
+  const lines = output.split("\n").map(line => line.trim());
   
   // Remove trailing empty lines
   while (lines.length > 0 && lines[lines.length - 1] === "") {
@@ -14,29 +16,66 @@ export function normalizeOutput(output: string): string[] {
   return lines;
 }
 
-export function compareOutputs(expected: string, actual: string): boolean {
-  const expectedLines = normalizeOutput(expected);
-  const actualLines = normalizeOutput(actual);
-  
-  if (expectedLines.length !== actualLines.length) {
-    return false;
+// Normalized expected output per test case id. Test cases are never edited in place
+// (admin updates delete and recreate them), so an id's expected output never changes.
+// Capped by total characters too, so a few huge expected outputs can't pin lots of memory.
+const expectedLinesCache = createBoundedCache<number, string[]>({
+  maxEntries: 5000,
+  maxSize: 16 * 1024 * 1024,
+  sizeOf: (lines) => lines.reduce((sum, line) => sum + line.length, 0),
+});
+
+function expectedLinesFor(testCase: { id: number; output: string }): string[] {
+  let lines = expectedLinesCache.get(testCase.id);
+  if (!lines) {
+    lines = normalizeOutput(testCase.output);
+    expectedLinesCache.set(testCase.id, lines);
   }
-  
-  for (let i = 0; i < expectedLines.length; i++) {
-    // Exact match after normalization (ignoring trailing whitespace)
-    if (expectedLines[i] !== actualLines[i]) {
-      // Sometimes numbers might be formatted differently (e.g. 1.0 vs 1)
-      // Let's do a strict string comparison for now, as that's standard for most OJs
+  return lines;
+}
+
+export function compareOutputs(
+  expected: string,
+  actual: string,
+  expectedLines?: string[]
+): boolean {
+  // Byte-identical output is by far the common accepted case: skip splitting/trimming entirely
+  if (actual === expected) {
+    return true;
+  }
+
+  expectedLines ??= normalizeOutput(expected);
+
+  // Walk the actual output one line at a time instead of splitting and trimming all of it
+  // up front, so a wrong answer bails at its first mismatching line
+  let lineIndex = 0;
+  let start = 0;
+  while (start <= actual.length) {
+    let end = actual.indexOf("\n", start);
+    if (end === -1) end = actual.length;
+    // trim() also drops the "\r" of CRLF line endings
+    const line = actual.slice(start, end).trim();
+    start = end + 1;
+
+    if (lineIndex < expectedLines.length) {
+      // Strict string comparison after trimming, as is standard for most OJs
+      if (line !== expectedLines[lineIndex]) {
+        return false;
+      }
+      lineIndex++;
+    } else if (line !== "") {
+      // Extra output past the expected lines; only trailing blank lines are allowed
       return false;
     }
   }
-  
-  return true;
+
+  return lineIndex === expectedLines.length;
 }
 
 export function evaluateExecution(
   runResult: RunResult,
-  expectedOutput: string
+  expectedOutput: string,
+  expectedLines?: string[]
 ): EvaluateResult {
   // Check for Time Limit Exceeded FIRST (Signal 9 or 137 indicates killed by OOM/Timeout)
   // Must be checked before RE because a killed process also has a non-zero exit code.
@@ -44,6 +83,14 @@ export function evaluateExecution(
     return { verdict: "TLE" };
   }
 
+  // Wandbox unreachable or too slow to answer — the submission was never judged
+  if (runResult.code === -1) {
+    return {
+      verdict: "IE",
+      details: { error: runResult.stderr }
+    };
+  }
+
   // Check for Compilation Error
   if (runResult.code !== 0 && runResult.stderr && !runResult.stdout) {
     return {
@@ -61,7 +108,7 @@ export function evaluateExecution(
   }
   
   // Compare outputs
-  const isCorrect = compareOutputs(expectedOutput, runResult.stdout);
+  const isCorrect = compareOutputs(expectedOutput, runResult.stdout, expectedLines);
   
   if (isCorrect) {
     return { verdict: "AC" };
@@ -75,3 +122,56 @@ export function evaluateExecution(
     };
   }
 }
+
+// Test cases run at once per submission; Wandbox is a shared public service, so keep this modest
+const JUDGE_CONCURRENCY = 4;
+
+export interface JudgedTestCase<T> {
+  testCase: T;
+  runResult: RunResult;
+  evalResult: EvaluateResult;
+}
+
+/**
+ * Run test cases concurrently and return the first failing one (in test case order),
+ * or null if every case is accepted. No new cases are started once a failure is seen.
+ */
+export async function runTestCases<T extends { id: number; input: string; output: string }>(
+  run: (input: string) => Promise<RunResult>,
+  testCases: T[],
+  concurrency: number = JUDGE_CONCURRENCY
+): Promise<JudgedTestCase<T> | null> {
+  let next = 0;
+  let failIndex = Infinity;
+  let failure: JudgedTestCase<T> | null = null;
+
+  const judgeNext = async () => {
+    const index = next++;
+    const testCase = testCases[index];
+    const runResult = await run(testCase.input);
+    const evalResult = evaluateExecution(runResult, testCase.output, expectedLinesFor(testCase));
+
+    if (evalResult.verdict !== "AC" && index < failIndex) {
+      failIndex = index;
+      failure = { testCase, runResult, evalResult };
+    }
+  };
+
+  const worker = async () => {
+    // Cases before a known failure still run, so the reported failure is the earliest one
+    while (next < testCases.length && next < failIndex) {
+      await judgeNext();
+    }
+  };
+
+  // A compilation error doesn't depend on the input, so judge the first case on its own:
+  // broken code then costs one request instead of a whole concurrent batch of CEs.
+  if (testCases.length > 0) {
+    await judgeNext();
+  }
+
+  const workerCount = Math.min(concurrency, testCases.length - next);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+
+  return failure;
+}
@@ -1,44 +1,136 @@
+import { createHash } from "node:crypto";
+import { compileFunction } from "node:vm";
 import { RunResult } from "@/types";
+import { createBoundedCache } from "@/lib/cache";
 
 // Wandbox - 100% free, no API key required, open source
 // https://wandbox.org
 const WANDBOX_API = "https://wandbox.org/api/compile.json";
 
-// Wandbox compiler names + predefined option keys (comma-separated)
-const LANGUAGE_MAP: Record<string, { compiler: string; options?: string }> = {
+// Wall-clock limit for one compile + run round-trip. It also covers Wandbox queueing, network
+// time and compilation, so a run that doesn't come back in time is an infrastructure failure
+// (→ IE), not a TLE; only Wandbox's own kill of the program is scored as TLE.
+const RUN_TIMEOUT_MS = 10_000;
+
+// Wandbox compiler names + predefined option keys (comma-separated) + raw compiler flags
+// (newline-separated). Warnings are suppressed: Wandbox reports them in compiler_error,
+// which would otherwise be mistaken for a failed compile.
+const LANGUAGE_MAP: Record<string, { compiler: string; options?: string; rawOptions?: string }> = {
   python:     { compiler: "cpython-3.12.7" },
-  cpp:        { compiler: "gcc-head",   options: "warning,c++17,optimize" },
-  c:          { compiler: "gcc-head-c", options: "warning,c11,optimize" },
+  cpp:        { compiler: "gcc-head",   options: "c++17,optimize", rawOptions: "-w\n-pipe" },
+  c:          { compiler: "gcc-head-c", options: "c11,optimize",   rawOptions: "-w\n-pipe" },
   java:       { compiler: "openjdk-jdk-21+35" },
   javascript: { compiler: "nodejs-20.3.0" },
 };
 
-export async function executeCode(
-  languageId: string,
-  code: string,
-  input: string = ""
-): Promise<RunResult> {
+// A submission's language/code resolved once, then run against many inputs
+export interface PreparedExecution {
+  // Serialized request body without its closing brace — each run appends its own stdin
+  bodyPrefix: string;
+  // Hash of compiler + options + code, shared by every run of this submission
+  codeKey: string;
+  // Set when the code is known not to compile; runs then fail locally without a round-trip
+  syntaxError?: string;
+}
+
+// CommonJS module wrapper parameters, so top-level `return`/`require` parse as they do under Node
+const CJS_WRAPPER_PARAMS = ["exports", "require", "module", "__filename", "__dirname"];
+
+/**
+ * Parse JavaScript in-process (the server runs the same Node major as Wandbox's nodejs-20)
+ * and return the SyntaxError report, if any. The code is compiled, never executed.
+ */
+function checkJavaScriptSyntax(code: string): string | undefined {
+  // A hashbang is only valid at the very start of a script, not inside the wrapper function
+  if (code.startsWith("#!")) return undefined;
+  try {
+    compileFunction(code, CJS_WRAPPER_PARAMS, { filename: "prog.js" });
+    return undefined;
+  } catch (error) {
+    if (!(error instanceof SyntaxError)) return undefined;
+    // The message has no location; like Node's own report, the stack opens with
+    // "prog.js:<line>", the offending source line and a caret, then the message
+    const report = error.stack?.split("\n    at ")[0].trimEnd();
+    return report?.startsWith("prog.js:") ? report : `prog.js: SyntaxError: ${error.message}`;
+  }
+}
+
+export function prepareExecution(languageId: string, code: string): PreparedExecution {
   const langConfig = LANGUAGE_MAP[languageId];
 
   if (!langConfig) {
     throw new Error(`Unsupported language: ${languageId}`);
   }
 
-  try {
-    const body: Record<string, string> = {
-      compiler: langConfig.compiler,
-      code,
-      stdin: input,
-    };
+  const body: Record<string, string> = {
+    compiler: langConfig.compiler,
+    code,
+  };
 
-    if (langConfig.options) {
-      body["options"] = langConfig.options;
-    }
+  if (langConfig.options) {
+    body["options"] = langConfig.options;
+  }
+
+  if (langConfig.rawOptions) {
+    body["compiler-option-raw"] = langConfig.rawOptions;
+  }
+
+  // Serialize and hash the (possibly large) source once instead of once per test case
+  const bodyPrefix = JSON.stringify(body).slice(0, -1);
+  return {
+    bodyPrefix,
+    codeKey: createHash("sha256").update(bodyPrefix).digest("hex"),
+    syntaxError: languageId === "javascript" ? checkJavaScriptSyntax(code) : undefined,
+  };
+}
+
+// Compiler errors, keyed by a hash of compiler + options + code. Wandbox can't keep a built
+// binary for us, but a failed compile is deterministic and independent of stdin, so the
+// same broken code is answered locally afterwards. Run results are never cached: programs
+// may depend on randomness or timing, and every submission must actually be executed.
+const compileErrorCache = createBoundedCache<string, string>({
+  maxEntries: 1000,
+  maxSize: 4 * 1024 * 1024,
+  sizeOf: (error) => error.length,
+});
 
+// Runs currently waiting on Wandbox — concurrent identical runs (the same canonical solution
+// submitted by several users at once) share one request instead of each sending their own
+const inFlightRuns = new Map<string, Promise<RunResult>>();
+
+export async function runPrepared(
+  prepared: PreparedExecution,
+  input: string = ""
+): Promise<RunResult> {
+  if (prepared.syntaxError) {
+    // Same shape as a Wandbox compile failure, so the judge reports CE
+    return { stdout: "", stderr: prepared.syntaxError, code: 1 };
+  }
+
+  const compileError = compileErrorCache.get(prepared.codeKey);
+  if (compileError !== undefined) {
+    return { stdout: "", stderr: compileError, code: 1 };
+  }
+
+  const key = `${prepared.codeKey}:${createHash("sha256").update(input).digest("hex")}`;
+  let pending = inFlightRuns.get(key);
+  if (!pending) {
+    pending = runOnWandbox(
+      `${prepared.bodyPrefix},"stdin":${JSON.stringify(input)}}`,
+      prepared.codeKey
+    ).finally(() => inFlightRuns.delete(key));
+    inFlightRuns.set(key, pending);
+  }
+  return pending;
+}
+
+async function runOnWandbox(body: string, codeKey: string): Promise<RunResult> {
+  try {
     const response = await fetch(WANDBOX_API, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(body),
+      body,
+      signal: AbortSignal.timeout(RUN_TIMEOUT_MS),
     });
 
     if (!response.ok) {
@@ -49,6 +141,7 @@ export async function executeCode(
 
     // Compilation error
     if (data.compiler_error) {
+      compileErrorCache.set(codeKey, data.compiler_error);
       return {
         stdout: "",
         stderr: data.compiler_error,
@@ -62,8 +155,17 @@ export async function executeCode(
       stdout: data.program_output ?? "",
       stderr: data.program_error ?? "",
       code: exitCode,
+      // Wandbox reports its own time/memory kill as "Killed"
+      signal: data.signal === "Killed" ? "SIGKILL" : data.signal,
     };
   } catch (error: any) {
+    if (error?.name === "TimeoutError") {
+      return {
+        stdout: "",
+        stderr: `Execution error: no response from Wandbox within ${RUN_TIMEOUT_MS / 1000}s`,
+        code: -1,
+      };
+    }
     return {
       stdout: "",
       stderr: `Execution error: ${error.message}`,
@@ -71,3 +173,11 @@ export async function executeCode(
     };
   }
 }
+
+export async function executeCode(
+  languageId: string,
+  code: string,
+  input: string = ""
+): Promise<RunResult> {
+  return runPrepared(prepareExecution(languageId, code), input);
+}
@@ -1,5 +1,7 @@
 import { z } from "zod";
 
+export const SUPPORTED_LANGUAGES = ["python", "cpp", "c", "java", "javascript"] as const;
+
 export const problemSchema = z.object({
   name: z.string().min(3, "Name must be at least 3 characters"),
   shortCode: z.string().min(2, "Short code must be at least 2 characters").regex(/^[A-Z0-9_-]+$/, "Uppercase letters, numbers, underscores, dashes only"),
@@ -21,5 +23,5 @@ export const createProblemSchema = problemSchema.extend({
 export const submissionSchema = z.object({
   problemId: z.number().int().positive(),
   codeText: z.string().min(10, "Code must be at least 10 characters"),
-  language: z.enum(["python", "cpp", "c", "java", "javascript"]),
+  language: z.enum(SUPPORTED_LANGUAGES),
 });
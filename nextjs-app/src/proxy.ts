@@ -28,6 +28,8 @@ export default auth((req) => {
   }
 });
 
+// Only the routes handled above need the session; public pages (problems, contests,
+// leaderboard, ...) skip the JWT decode entirely.
 export const config = {
-  matcher: ["/((?!api|_next/static|_next/image|favicon.ico).*)"],
+  matcher: ["/login/:path*", "/register/:path*", "/submissions/:path*", "/admin/:path*"],
 };